@@ -8,6 +8,8 @@ from datetime import datetime
 from event.type import OrderBook, OrderBookGapError
 from infrastructure.logger import logger
 
+_INF = math.inf
+
 
 class LocalOrderBook:
     def __init__(
@@ -45,6 +47,10 @@ class LocalOrderBook:
         self.best_ask_volume = 0.0
         self.top_bids = ()
         self.top_asks = ()
+        # Published level tuples are replaced, never mutated, so the tuple
+        # identity versions the price->volume view built from it.
+        self._bid_view = ((), {})
+        self._ask_view = ((), {})
 
     def init_snapshot(self, snapshot_data: dict):
         self.initialized = False
@@ -174,10 +180,16 @@ class LocalOrderBook:
         if ask_levels_dirty:
             self._recompute_published_ask_levels()
 
-        try:
-            self._validate_book(self.bids, self.asks)
-        except ValueError as exc:
-            self._reject_integrity(str(exc))
+        # The cached best quotes are maintained exactly by the level updates
+        # above, so the crossed-book check no longer rescans every level.
+        if not self.bids or not self.asks:
+            self._reject_integrity("order book side is empty")
+        if self.best_bid_price >= self.best_ask_price:
+            self._reject_integrity(
+                "crossed order book "
+                f"best_bid={self.best_bid_price} "
+                f"best_ask={self.best_ask_price}"
+            )
 
         self.last_update_id = u
         self._awaiting_first_delta = False
@@ -203,8 +215,22 @@ class LocalOrderBook:
             corrected_received_ts = received_ts + clock_offset_ms / 1000.0
         dispatch_ts = time.time()
         dispatch_monotonic = time.perf_counter()
-        bids = self.bids.copy() if self.emit_full_book else {price: volume for price, volume in self.top_bids}
-        asks = self.asks.copy() if self.emit_full_book else {price: volume for price, volume in self.top_asks}
+        # Events share the view of an unchanged side instead of rebuilding
+        # it; consumers treat OrderBook levels as read-only. In full-book
+        # mode every level change replaces the side's top tuple, because
+        # _level_frontier_impacted is unconditional there.
+        if self._bid_view[0] is not self.top_bids:
+            self._bid_view = (
+                self.top_bids,
+                self.bids.copy() if self.emit_full_book else dict(self.top_bids),
+            )
+        if self._ask_view[0] is not self.top_asks:
+            self._ask_view = (
+                self.top_asks,
+                self.asks.copy() if self.emit_full_book else dict(self.top_asks),
+            )
+        bids = self._bid_view[1]
+        asks = self._ask_view[1]
         depth_levels = max(len(bids), len(asks)) if self.emit_full_book else max(len(self.top_bids), len(self.top_asks))
         return OrderBook(
             symbol=self.symbol,
@@ -240,9 +266,11 @@ class LocalOrderBook:
                 raise ValueError(f"invalid {side} level")
             price = float(entry[0])
             qty = float(entry[1])
-            if not math.isfinite(price) or price <= 0.0:
+            # Chained comparisons are False for NaN, so one test per field
+            # covers finiteness and sign.
+            if not 0.0 < price < _INF:
                 raise ValueError(f"invalid {side} price: {price!r}")
-            if not math.isfinite(qty) or qty < 0.0:
+            if not 0.0 <= qty < _INF:
                 raise ValueError(f"invalid {side} quantity: {qty!r}")
             if qty > 0.0 or keep_zero:
                 levels[price] = qty
@@ -301,6 +329,13 @@ class LocalOrderBook:
                     self._recompute_best_bid()
             return levels_dirty
 
+        if levels_dirty and price in self.bids:
+            # A volume change on an already published level keeps the
+            # ordering, so patch it instead of reselecting the top levels.
+            patched = self._replace_level_volume(self.top_bids, price, qty)
+            if patched is not None:
+                self.top_bids = patched
+                levels_dirty = False
         self.bids[price] = qty
         if price >= current_best:
             self.best_bid_price = price
@@ -319,6 +354,11 @@ class LocalOrderBook:
                     self._recompute_best_ask()
             return levels_dirty
 
+        if levels_dirty and price in self.asks:
+            patched = self._replace_level_volume(self.top_asks, price, qty)
+            if patched is not None:
+                self.top_asks = patched
+                levels_dirty = False
         self.asks[price] = qty
         if current_best == 0.0 or price <= current_best:
             self.best_ask_price = price
@@ -354,24 +394,28 @@ class LocalOrderBook:
 
     def _recompute_published_bid_levels(self):
         depth = self.publish_depth_levels
-        self.top_bids = tuple(
-            heapq.nlargest(depth, self.bids.items(), key=lambda item: item[0])
-        )
+        # Prices are unique dict keys, so tuple ordering never reaches the
+        # volume and no key function is needed.
+        self.top_bids = tuple(heapq.nlargest(depth, self.bids.items()))
 
     def _recompute_published_ask_levels(self):
         depth = self.publish_depth_levels
-        self.top_asks = tuple(
-            heapq.nsmallest(depth, self.asks.items(), key=lambda item: item[0])
-        )
+        self.top_asks = tuple(heapq.nsmallest(depth, self.asks.items()))
+
+    @staticmethod
+    def _replace_level_volume(levels, price: float, qty: float):
+        for index, (level_price, _volume) in enumerate(levels):
+            if level_price == price:
+                return levels[:index] + ((price, qty),) + levels[index + 1:]
+        return None
 
     def _level_frontier_impacted(self, price: float, levels, descending: bool):
         if self.emit_full_book:
             return True
         if not levels:
             return True
-        level_prices = {level_price for level_price, _ in levels}
-        if price in level_prices:
-            return True
+        # Every published level lies on or inside the frontier, so a
+        # frontier comparison also covers updates to published prices.
         if len(levels) < self.publish_depth_levels:
             return True
         frontier_price = levels[-1][0]
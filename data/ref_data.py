@@ -162,13 +162,25 @@ class ReferenceDataManager:
         if info.step_size == 0:
             return qty
 
-        # Use decimal arithmetic with a tiny step-relative epsilon so values
-        # like 2.4/0.1 do not become 23.999999... and round down to 2.3.
-        qty_dec = Decimal(str(qty))
-        step_dec = Decimal(str(info.step_size))
-        epsilon = step_dec * Decimal("1e-9")
-        steps = ((qty_dec + epsilon) / step_dec).to_integral_value(rounding=ROUND_DOWN)
-        rounded = steps * step_dec
+        steps = _floor_qty_steps(qty, info.step_size)
+        rounded = steps * Decimal(str(info.step_size))
         return round(float(rounded), info.qty_precision)
 
+    def qty_to_steps(self, symbol, qty) -> int:
+        """将数量向下取整为 step_size 的整数倍数 (与 round_qty 同一规则)"""
+        info = self.get_info(symbol)
+        if not info or info.step_size <= 0:
+            raise ValueError(f"No stepSize reference data for {symbol}")
+        return int(_floor_qty_steps(qty, info.step_size))
+
+
+def _floor_qty_steps(qty, step_size) -> Decimal:
+    # Use decimal arithmetic with a tiny step-relative epsilon so values
+    # like 2.4/0.1 do not become 23.999999... and round down to 2.3.
+    qty_dec = Decimal(str(qty))
+    step_dec = Decimal(str(step_size))
+    epsilon = step_dec * Decimal("1e-9")
+    return ((qty_dec + epsilon) / step_dec).to_integral_value(rounding=ROUND_DOWN)
+
+
 ref_data_manager = ReferenceDataManager()
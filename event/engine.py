@@ -1,5 +1,6 @@
 from collections import defaultdict, deque
-from queue import Empty, Full, Queue
+from itertools import count
+from queue import Empty, SimpleQueue
 from threading import Condition, Lock, RLock, Thread, local
 import time
 
@@ -17,12 +18,14 @@ class EventEngine:
         self._stopping = False
         self._rejected_put_count = 0
         self.profile_config = self._build_profile_config(profile_config or {})
-        self._queues = {
-            lane: Queue(maxsize=self.profile_config["queue_capacity"][lane])
-            for lane in self.ALL_LANES
-        }
+        # SimpleQueue hands items over without the Condition bookkeeping of
+        # queue.Queue; lane capacity is enforced in _enqueue from the
+        # timestamp ledger, which is already maintained under _lock.
+        self._queues = {lane: SimpleQueue() for lane in self.ALL_LANES}
         self._threads = {}
         self._handlers = {lane: defaultdict(list) for lane in self.ALL_LANES}
+        # event type -> (hot lanes, cold registered); rebuilt after register.
+        self._routes = {}
         self._queue_timestamps = {lane: deque() for lane in self.ALL_LANES}
         self._lane_stats = {
             lane: {
@@ -56,7 +59,9 @@ class EventEngine:
         }
         self._pending_cold = {}
         self._pending_work = 0
-        self._dispatch_seq = 0
+        # next() on a count is a single C call, so dispatch ids are unique
+        # across producer threads without taking _lock a second time per put.
+        self._dispatch_ids = count(1)
         self._lock = Lock()
         self._idle_condition = Condition(self._lock)
         self._admission_lock = RLock()
@@ -234,12 +239,10 @@ class EventEngine:
                 return False
 
             dispatch_id = self._next_dispatch_id()
-            hot_lanes = [
-                lane
-                for lane in self.HOT_LANES
-                if event.type in self._handlers[lane]
-            ]
-            cold_registered = event.type in self._handlers["cold"]
+            route = self._routes.get(event.type)
+            if route is None:
+                route = self._route(event.type)
+            hot_lanes, cold_registered = route
             if not hot_lanes and not cold_registered:
                 return True
 
@@ -264,6 +267,16 @@ class EventEngine:
                 accepted = self._enqueue("cold", dispatch_id, event)
             return accepted
 
+    def _route(self, type_):
+        route = (
+            tuple(
+                lane for lane in self.HOT_LANES if type_ in self._handlers[lane]
+            ),
+            type_ in self._handlers["cold"],
+        )
+        self._routes[type_] = route
+        return route
+
     def register(self, type_, handler):
         self.register_cold(type_, handler)
 
@@ -271,13 +284,19 @@ class EventEngine:
         self.register_execution(type_, handler)
 
     def register_market(self, type_, handler):
-        self._handlers["market"][type_].append(handler)
+        with self._admission_lock:
+            self._handlers["market"][type_].append(handler)
+            self._routes.clear()
 
     def register_execution(self, type_, handler):
-        self._handlers["execution"][type_].append(handler)
+        with self._admission_lock:
+            self._handlers["execution"][type_].append(handler)
+            self._routes.clear()
 
     def register_cold(self, type_, handler):
-        self._handlers["cold"][type_].append(handler)
+        with self._admission_lock:
+            self._handlers["cold"][type_].append(handler)
+            self._routes.clear()
 
     def set_failure_handler(self, handler):
         if handler is not None and not callable(handler):
@@ -363,28 +382,21 @@ class EventEngine:
         return rows
 
     def _next_dispatch_id(self):
-        with self._lock:
-            self._dispatch_seq += 1
-            return self._dispatch_seq
+        return next(self._dispatch_ids)
 
     def _enqueue(self, lane: str, dispatch_id: int, event) -> bool:
         enqueued_at = time.perf_counter()
-        overflow = False
+        capacity = self.profile_config["queue_capacity"][lane]
         with self._idle_condition:
-            self._queue_timestamps[lane].append(enqueued_at)
-            self._pending_work += 1
-            try:
+            queue_timestamps = self._queue_timestamps[lane]
+            overflow = len(queue_timestamps) >= capacity
+            if not overflow:
+                queue_timestamps.append(enqueued_at)
+                self._pending_work += 1
                 self._queues[lane].put_nowait(
                     (dispatch_id, enqueued_at, event)
                 )
-            except Full:
-                overflow = True
-                self._queue_timestamps[lane].pop()
-                self._pending_work -= 1
-                if self._pending_work == 0:
-                    self._idle_condition.notify_all()
         if overflow:
-            capacity = self.profile_config["queue_capacity"][lane]
             error = RuntimeError(
                 f"event queue full: lane={lane} capacity={capacity}"
             )
@@ -379,7 +379,7 @@ class OrderStateSnapshot:
     recovered_from_journal: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderData:
     symbol: str
     order_id: str
@@ -391,7 +391,7 @@ class OrderData:
     datetime: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeData:
     symbol: str
     order_id: str
@@ -1,8 +1,21 @@
 # file: execution/algo_base.py
 
-from event.type import OrderData, OrderBook
+from data.ref_data import ref_data_manager
+from event.type import OrderData, OrderBook, OrderStatus
 from event.type import Status_ALLTRADED, Status_CANCELLED, Status_REJECTED
 
+# 预先构建状态集合：同时接受旧版字符串常量与 OrderStatus 枚举，
+# 判断只需一次集合查找
+FILLED_STATUSES = frozenset({Status_ALLTRADED, OrderStatus.FILLED})
+FINISHED_STATUSES = FILLED_STATUSES | {
+    Status_CANCELLED,
+    Status_REJECTED,
+    OrderStatus.CANCELLED,
+    OrderStatus.REJECTED,
+    OrderStatus.REJECTED_LOCALLY,
+    OrderStatus.EXPIRED,
+}
+
 class AlgoTemplate:
     """
     执行算法基类
@@ -12,15 +25,42 @@ class AlgoTemplate:
         self.algo_id = algo_id
         self.symbol = symbol
         self.direction = direction # BUY/SELL
-        self.total_vol = total_vol
+
+        # 数量统一以整数 lot (stepSize 的倍数) 计算，只在下单边界换算回数量。
+        # 没有参考数据时直接报错，不猜测步长
+        info = ref_data_manager.get_info(symbol)
+        if info is None or info.step_size <= 0:
+            raise ValueError(f"[{algo_id}] {symbol} 缺少 stepSize 参考数据")
+        self.step = info.step_size
+        self.qty_precision = info.qty_precision
+        self.total_lots = self.to_lots(total_vol)
         
         self.engine = engine
         self.strategy = strategy # 引用策略以便调用 buy/sell/cancel
         
-        self.traded_vol = 0.0
-        self.active_orders = {} # child_order_id -> vol
+        self.traded_lots = 0
+        self.active_orders = {} # child_order_id -> lots
         self.finished = False
 
+    def to_lots(self, volume) -> int:
+        # 与 round_qty 一致向下取整，母单与成交都不会被放大
+        return ref_data_manager.qty_to_steps(self.symbol, volume)
+
+    def to_volume(self, lots: int) -> float:
+        return round(lots * self.step, self.qty_precision)
+
+    @property
+    def total_vol(self) -> float:
+        return self.to_volume(self.total_lots)
+
+    @property
+    def traded_vol(self) -> float:
+        return self.to_volume(self.traded_lots)
+
+    @property
+    def left_lots(self) -> int:
+        return self.total_lots - self.traded_lots
+
     def start(self):
         """启动算法"""
         pass
@@ -37,15 +77,17 @@ class AlgoTemplate:
     def on_order(self, order: OrderData):
         """订单状态更新"""
         if order.order_id in self.active_orders:
-            if order.status in [Status_ALLTRADED, Status_CANCELLED, Status_REJECTED]:
+            status = order.status
+            if status in FINISHED_STATUSES:
                 del self.active_orders[order.order_id]
                 
-            if order.status == Status_ALLTRADED:
-                self.traded_vol += order.volume
-                if self.traded_vol >= self.total_vol - 1e-8:
+            if status in FILLED_STATUSES:
+                self.traded_lots += self.to_lots(order.volume)
+                if self.traded_lots >= self.total_lots:
                     self.finished = True
                     print(f"[{self.algo_id}] 算法执行完毕: {self.traded_vol}/{self.total_vol}")
 
     def cancel_all(self):
-        for oid in list(self.active_orders.keys()):
+        # 只撤本算法的子单；按品种批量撤单会误撤同品种的其他订单
+        for oid in tuple(self.active_orders):
             self.strategy.cancel_order(oid)
@@ -44,9 +44,10 @@ class ChaseAlgo(AlgoTemplate):
             self._send_new(target_price)
 
     def _send_new(self, price):
-        left = self.total_vol - self.traded_vol
-        if left <= 0:
+        left_lots = self.left_lots
+        if left_lots <= 0:
             return
+        left = self.to_volume(left_lots)
         
         if self.direction == "BUY":
             # 使用 PostOnly (GTX) 确保只做 Maker
@@ -58,5 +59,5 @@ class ChaseAlgo(AlgoTemplate):
             
         if oid:
             self.current_oid = oid
-            self.active_orders[oid] = left
+            self.active_orders[oid] = left_lots
             self.last_price = price
@@ -9,7 +9,7 @@ class TWAPAlgo(AlgoTemplate):
         self.duration = duration   # 总时长 (秒)
         self.interval = interval   # 切片间隔 (秒)
         
-        self.slice_vol = total_vol / (duration / interval)
+        self.slice_lots = max(1, int(self.total_lots * interval // duration)) if duration > 0 else self.total_lots
         self.next_run_time = time.time()
         self.end_time = time.time() + duration
 
@@ -30,11 +30,16 @@ class TWAPAlgo(AlgoTemplate):
         # 简单 TWAP：市价吃单 (Taker) 或 对手价限价 (Aggressive Limit)
         # 这里用对手价
         price = ob.get_best_ask()[0] if self.direction == "BUY" else ob.get_best_bid()[0]
+
+        lots = min(self.slice_lots, self.left_lots)
+        if lots <= 0:
+            return
+        volume = self.to_volume(lots)
         
         if self.direction == "BUY":
-            oid = self.strategy.buy(self.symbol, price, self.slice_vol)
+            oid = self.strategy.buy(self.symbol, price, volume)
         else:
-            oid = self.strategy.sell(self.symbol, price, self.slice_vol)
+            oid = self.strategy.sell(self.symbol, price, volume)
             
         if oid:
-            self.active_orders[oid] = self.slice_vol
+            self.active_orders[oid] = lots
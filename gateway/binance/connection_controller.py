@@ -19,6 +19,7 @@ class BinanceConnectionDependencies:
     join_book_recovery_threads: Callable[[], bool]
     book_recovery_threads_stopped: Callable[[], bool]
     apply_account_configuration: Callable[[], bool]
+    warm_order_path: Callable[[], None]
     create_ws: Callable[[int], object]
     start_streams: Callable[[object, list[str], int], bool]
     stop_user_stream: Callable[[], bool]
@@ -71,6 +72,12 @@ class BinanceConnectionController:
                     "ACCOUNT_CONFIG_FAILED"
                 )
             return False
+        # Best effort: the first order should not pay the TCP and TLS
+        # handshakes. A failed warm-up leaves the pool to connect lazily.
+        try:
+            self.dependencies.warm_order_path()
+        except Exception as exc:
+            self.dependencies.log_warning(f"Order path warm-up failed: {exc}")
 
         candidate_ws = self.dependencies.create_ws(generation)
         with self.dependencies.transport_lock:
@@ -18,6 +18,7 @@ EP_RPI_DEPTH = "/fapi/v1/rpiDepth"
 EP_ORDER = "/fapi/v1/order"
 EP_LISTEN_KEY = "/fapi/v1/listenKey"
 EP_TIME = "/fapi/v1/time"
+EP_PING = "/fapi/v1/ping"
 EP_EXCHANGE_INFO = "/fapi/v1/exchangeInfo"
 EP_LEVERAGE = "/fapi/v1/leverage"
 EP_MARGIN_TYPE = "/fapi/v1/marginType"
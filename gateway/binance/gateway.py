@@ -28,6 +28,7 @@ from .connection_controller import (
     BinanceConnectionController,
     BinanceConnectionDependencies,
 )
+from .constants import EP_ALL_OPEN_ORDERS, EP_ORDER, EP_PING
 from .gateway_facade_fields import BinanceGatewayCompatibilityFields
 from .http_adapter import HFTAdapter
 from .rest_api import BinanceRestApi
@@ -77,6 +78,14 @@ class BinanceGateway(BinanceGatewayCompatibilityFields, BaseGateway):
             testnet,
             rate_limit_budget=rate_limit_budget,
         )
+        # requests picks the longest mounted prefix, so order entry, cancel,
+        # cancel-all and order queries share their own small pool and
+        # snapshot bursts never take the warm order-path connections.
+        order_adapter = HFTAdapter(pool_connections=2, pool_maxsize=4)
+        for endpoint in (EP_ORDER, EP_ALL_OPEN_ORDERS):
+            self.session.mount(f"{self.rest.base_url}{endpoint}?", order_adapter)
+        # Pings share the pool so connect can open it before the first order.
+        self.session.mount(f"{self.rest.base_url}{EP_PING}", order_adapter)
         self.require_healthy_clock = True
         self.rest.order_clock_guard = self._clock_health_guard
         # A websocket is bound to the book lifecycle generation at connect
@@ -158,6 +167,16 @@ class BinanceGateway(BinanceGatewayCompatibilityFields, BaseGateway):
             if math.isfinite(ingress_age_ms) and ingress_age_ms >= 100.0
             else 1000.0
         )
+        # Always a stream -> core map: per-stream cores keep the three FIFO
+        # receive threads from contending for one core; unlisted streams
+        # fall back to ws_cpu (None leaves placement to the kernel).
+        default_cpu = market_data_config.get("ws_cpu")
+        stream_cpus = dict(market_data_config.get("ws_stream_cpus") or {})
+        self.ws_cpu = {
+            name: stream_cpus.get(name, default_cpu)
+            for name in ("PublicWS", "MarketWS", "UserWS")
+        }
+        self.ws_fifo_priority = market_data_config.get("ws_fifo_priority")
         self._account_configuration_component = (
             self._build_account_configuration_controller()
         )
@@ -272,6 +291,7 @@ class BinanceGateway(BinanceGatewayCompatibilityFields, BaseGateway):
                 apply_account_configuration=(
                     lambda: self._apply_account_trading_configuration()
                 ),
+                warm_order_path=lambda: self.rest.ping(),
                 create_ws=lambda generation: self._new_ws(generation),
                 start_streams=lambda _ws, _symbols, generation: (
                     self._start_streams(
@@ -515,6 +535,8 @@ class BinanceGateway(BinanceGatewayCompatibilityFields, BaseGateway):
                 expected_generation=generation,
             ),
             self.testnet,
+            receive_cpu=self.ws_cpu,
+            receive_fifo_priority=self.ws_fifo_priority,
         )
 
     def on_ws_message(self, raw_msg, *, expected_generation=None):
@@ -5,11 +5,31 @@ import socket
 from requests.adapters import HTTPAdapter
 
 
+def _platform_socket_options():
+    options = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    # Linux-only knobs are applied when the platform exposes them: ACK
+    # small REST responses immediately and detect dead order-path
+    # connections in under a minute.
+    optional = (
+        ("TCP_QUICKACK", 1),
+        ("TCP_KEEPIDLE", 30),
+        ("TCP_KEEPINTVL", 10),
+        ("TCP_KEEPCNT", 3),
+    )
+    for name, value in optional:
+        option = getattr(socket, name, None)
+        if option is not None:
+            options.append((socket.IPPROTO_TCP, option, value))
+    return tuple(options)
+
+
+HFT_SOCKET_OPTIONS = _platform_socket_options()
+
+
 class HFTAdapter(HTTPAdapter):
     def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
-        pool_kwargs["socket_options"] = [
-            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
-            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
-        ]
+        pool_kwargs["socket_options"] = list(HFT_SOCKET_OPTIONS)
         super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
-
@@ -6,6 +6,7 @@ import math
 import time
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 
 from event.type import (
     AggTradeData,
@@ -15,6 +16,39 @@ from event.type import (
     EVENT_ORDERBOOK,
 )
 
+# Chained comparisons reject NaN and infinities in one interpreter step,
+# replacing a math.isfinite call plus a sign check per numeric field.
+_INF = math.inf
+
+
+@lru_cache(maxsize=32)
+def _funding_datetime(next_funding_timestamp: float) -> datetime:
+    # Every symbol repeats the same next-funding instant on each 1s mark
+    # tick until the 8h settlement rolls, so the conversion is shared.
+    return datetime.fromtimestamp(next_funding_timestamp)
+
+
+# Channel segment of "<symbol>@<channel>[@<speed>]" to the event it carries.
+_STREAM_CHANNELS = {
+    "aggTrade": EVENT_AGG_TRADE,
+    "markPrice": EVENT_MARK_PRICE,
+    "depth": EVENT_ORDERBOOK,
+}
+_INGRESS_FRESHNESS_EVENTS = frozenset({EVENT_AGG_TRADE, EVENT_ORDERBOOK})
+
+
+@lru_cache(maxsize=1024)
+def _stream_event_type(stream: str) -> str | None:
+    # Subscribed stream names are a small fixed set, so the split and the
+    # prefix fallback run once per stream rather than once per frame.
+    channel = stream.split("@", 2)[1] if "@" in stream else ""
+    event_type = _STREAM_CHANNELS.get(channel)
+    if event_type is None:
+        for prefix, candidate in _STREAM_CHANNELS.items():
+            if channel.startswith(prefix):
+                return candidate
+    return event_type
+
 
 @dataclass(frozen=True)
 class BinanceMarketEnvelope:
@@ -28,10 +62,11 @@ class BinanceMarketEnvelope:
     received_monotonic: float
     corrected_received_timestamp: float
     clock_offset_ms: float
+    event_type: str | None = None
 
     @property
     def requires_ingress_freshness(self) -> bool:
-        return "@aggTrade" in self.stream or "@depth" in self.stream
+        return self.event_type in _INGRESS_FRESHNESS_EVENTS
 
 
 @dataclass(frozen=True)
@@ -55,7 +90,10 @@ class BinanceMarketStreamParser:
         monotonic=time.perf_counter,
     ) -> BinanceMarketEnvelope:
         stream = str(msg["stream"])
-        data = dict(msg["data"])
+        event_type = _stream_event_type(stream)
+        # Read-only view of the wire payload; only depth normalization adds
+        # keys, and it copies before doing so.
+        data = msg["data"]
         received_timestamp = float(received_timestamp or now())
         received_monotonic = float(received_monotonic or monotonic())
         clock_offset_ms = float(clock_offset_ms)
@@ -65,7 +103,7 @@ class BinanceMarketStreamParser:
         )
         event_time_ms = int(
             data.get("E", 0)
-            or (0 if "@markPrice" in stream else data.get("T", 0))
+            or (0 if event_type == EVENT_MARK_PRICE else data.get("T", 0))
             or 0
         )
         return BinanceMarketEnvelope(
@@ -77,6 +115,7 @@ class BinanceMarketStreamParser:
             received_monotonic=received_monotonic,
             corrected_received_timestamp=corrected_received_timestamp,
             clock_offset_ms=clock_offset_ms,
+            event_type=event_type,
         )
 
     @classmethod
@@ -84,21 +123,13 @@ class BinanceMarketStreamParser:
         cls,
         envelope: BinanceMarketEnvelope,
     ) -> BinanceMarketUpdate | None:
-        if "@aggTrade" in envelope.stream:
-            return BinanceMarketUpdate(
-                EVENT_AGG_TRADE,
-                cls._agg_trade(envelope),
-            )
-        if "@markPrice" in envelope.stream:
-            return BinanceMarketUpdate(
-                EVENT_MARK_PRICE,
-                cls._mark_price(envelope),
-            )
-        if "@depth" in envelope.stream:
-            return BinanceMarketUpdate(
-                EVENT_ORDERBOOK,
-                cls._depth(envelope),
-            )
+        event_type = envelope.event_type
+        if event_type == EVENT_AGG_TRADE:
+            return BinanceMarketUpdate(event_type, cls._agg_trade(envelope))
+        if event_type == EVENT_MARK_PRICE:
+            return BinanceMarketUpdate(event_type, cls._mark_price(envelope))
+        if event_type == EVENT_ORDERBOOK:
+            return BinanceMarketUpdate(event_type, cls._depth(envelope))
         return None
 
     @staticmethod
@@ -112,12 +143,9 @@ class BinanceMarketStreamParser:
         quantity = float(data["q"])
         if (
             trade_id < 0
-            or not math.isfinite(price)
-            or price <= 0.0
-            or not math.isfinite(quantity)
-            or quantity <= 0.0
-            or not math.isfinite(exchange_timestamp)
-            or exchange_timestamp <= 0.0
+            or not 0.0 < price < _INF
+            or not 0.0 < quantity < _INF
+            or not 0.0 < exchange_timestamp < _INF
         ):
             raise ValueError(
                 f"invalid aggTrade payload for {envelope.symbol}"
@@ -149,15 +177,11 @@ class BinanceMarketStreamParser:
         index_price = float(data["i"])
         funding_rate = float(data["r"])
         if (
-            not math.isfinite(mark_price)
-            or mark_price <= 0.0
-            or not math.isfinite(index_price)
-            or index_price <= 0.0
-            or not math.isfinite(funding_rate)
-            or not math.isfinite(exchange_timestamp)
-            or exchange_timestamp <= 0.0
-            or not math.isfinite(next_funding_timestamp)
-            or next_funding_timestamp <= 0.0
+            not 0.0 < mark_price < _INF
+            or not 0.0 < index_price < _INF
+            or not -_INF < funding_rate < _INF
+            or not 0.0 < exchange_timestamp < _INF
+            or not 0.0 < next_funding_timestamp < _INF
         ):
             raise ValueError(
                 f"invalid markPrice payload for {envelope.symbol}"
@@ -167,7 +191,7 @@ class BinanceMarketStreamParser:
             mark_price,
             index_price,
             funding_rate,
-            datetime.fromtimestamp(next_funding_timestamp),
+            _funding_datetime(next_funding_timestamp),
             datetime.fromtimestamp(exchange_timestamp),
             exchange_timestamp=exchange_timestamp,
             received_timestamp=envelope.received_timestamp,
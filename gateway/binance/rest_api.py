@@ -1,5 +1,6 @@
 import hashlib
 import hmac
+import re
 import threading
 import time
 from urllib.parse import urlencode
@@ -24,6 +25,7 @@ from .constants import (
     EP_OPEN_ORDERS,
     EP_ORDER,
     EP_POSITION_MODE,
+    EP_PING,
     EP_POSITION_RISK,
     EP_RPI_DEPTH,
     EP_TIME,
@@ -34,6 +36,27 @@ from .constants import (
 from .rate_limit_budget import BinanceRateLimitBudget
 from .rest_metrics import BinanceRestMetrics
 
+# Characters urlencode leaves unquoted, plus the separators it emits.
+_PLAIN_QUERY = re.compile(r"[A-Za-z0-9_.~=&-]*").fullmatch
+
+
+def _encode_query(params: dict) -> str:
+    """Encode ``params`` exactly as ``urlencode`` would, without quoting.
+
+    Binance parameters are symbols, enums, numbers and client ids, so the
+    plain join is already the urlencoded form. The separator counts prove
+    no key or value carried its own ``=`` or ``&``; anything else falls
+    back to ``urlencode``.
+    """
+    query = "&".join([f"{key}={value}" for key, value in params.items()])
+    if (
+        _PLAIN_QUERY(query)
+        and query.count("=") == len(params)
+        and query.count("&") == len(params) - 1
+    ):
+        return query
+    return urlencode(params)
+
 
 class _LocalGuardResponse:
     def __init__(self, code: str, message: str):
@@ -92,12 +115,66 @@ class BinanceRestApi:
         self.clock_resync_callback = None
         self.telemetry = BinanceRestMetrics()
         self._last_budget_rejection_log_at = 0.0
+        # (method, url, signed) -> (session, api_key, prepared template)
+        self._prepared_templates = {}
+
+    @property
+    def api_secret(self):
+        return self._api_secret
+
+    @api_secret.setter
+    def api_secret(self, secret):
+        # HMAC key setup is paid once per secret; each signature copies the
+        # pre-keyed state instead of re-deriving the inner/outer pads.
+        self._api_secret = secret
+        self._hmac_template = hmac.new(
+            str(secret or "").encode(), digestmod=hashlib.sha256
+        )
 
-    def _sign(self, params: dict):
-        query = urlencode(params)
-        signature = hmac.new(self.api_secret.encode(), query.encode(), hashlib.sha256).hexdigest()
-        params["signature"] = signature
-        return params
+    def _signed_query(self, params: dict) -> str:
+        # The signed string is the exact URL query, so it is encoded once
+        # and sent as-is instead of being re-encoded by requests.
+        query = _encode_query(params)
+        mac = self._hmac_template.copy()
+        mac.update(query.encode())
+        return f"{query}&signature={mac.hexdigest()}"
+
+    def _prepare_request(self, method, url, signed, query):
+        session = self.session
+        if getattr(session, "cookies", None):
+            # Cookie merging is per request, so a frozen template would
+            # replay a stale jar; keep the full session preparation.
+            headers = {"X-MBX-APIKEY": self.api_key} if signed else {}
+            return session.prepare_request(
+                requests.Request(
+                    method,
+                    f"{url}?{query}" if query else url,
+                    headers=headers,
+                )
+            )
+        key = (method, url, signed)
+        templates = self._prepared_templates
+        cached = templates.get(key)
+        if (
+            cached is None
+            or cached[0] is not session
+            or cached[1] is not self.api_key
+        ):
+            # Header merge, URL normalization and hook setup are paid once
+            # per route; each send copies the template and swaps the query.
+            headers = {"X-MBX-APIKEY": self.api_key} if signed else {}
+            cached = (
+                session,
+                self.api_key,
+                session.prepare_request(
+                    requests.Request(method, url, headers=headers)
+                ),
+            )
+            templates[key] = cached
+        prepped = cached[2].copy()
+        if query:
+            prepped.url = f"{prepped.url}?{query}"
+        return prepped
 
     def _throttle(
         self,
@@ -427,7 +504,6 @@ class BinanceRestApi:
     ):
         url = self.base_url + endpoint
         base_params = dict(params or {})
-        headers = {"X-MBX-APIKEY": self.api_key} if signed else {}
         suppress_error_codes = {str(code) for code in (suppress_error_codes or set())}
 
         attempt_limit = (
@@ -451,11 +527,12 @@ class BinanceRestApi:
             if signed:
                 req_params["timestamp"] = time_service.now()
                 req_params["recvWindow"] = self.recv_window_ms
-                self._sign(req_params)
+                query = self._signed_query(req_params)
+            else:
+                query = _encode_query(req_params)
 
             try:
-                req = requests.Request(method, url, params=req_params, headers=headers)
-                prepped = self.session.prepare_request(req)
+                prepped = self._prepare_request(method, url, signed, query)
                 guard_rejection = self._run_pre_send_guard(pre_send_guard)
                 if guard_rejection is not None:
                     return guard_rejection
@@ -688,6 +765,9 @@ class BinanceRestApi:
             rate_limit_priority="emergency" if emergency else None,
         )
 
+    def ping(self):
+        return self.request("GET", EP_PING, signed=False, max_attempts=1)
+
     def get_positions(self, *, emergency=False):
         return self.request(
             "GET",
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import threading
 from collections.abc import Callable, MutableMapping
 from dataclasses import dataclass
 
@@ -11,6 +12,10 @@ from event.type import EVENT_ORDERBOOK
 from .account_stream import BinanceAccountStreamParser
 from .market_stream import BinanceMarketStreamParser
 
+# Bound once: json.loads re-checks its arguments and input type on every call,
+# which costs roughly a seventh of a depth-frame decode.
+_decode_frame = json.JSONDecoder().decode
+
 
 @dataclass(frozen=True)
 class BinanceWebSocketDependencies:
@@ -37,8 +42,14 @@ class BinanceWebSocketDependencies:
 class BinanceWebSocketDispatcher:
     """Parse and route one transport generation without owning transport state."""
 
+    ignored_payload_log_every = 100
+
     def __init__(self, dependencies: BinanceWebSocketDependencies) -> None:
         self.dependencies = dependencies
+        self.ignored_payload_count = 0
+        # Market and user streams call on_message from separate receive
+        # threads, so the counter and its log cadence share one lock.
+        self._ignored_payload_lock = threading.Lock()
 
     def on_message(self, raw_msg, *, expected_generation=None) -> None:
         dependencies = self.dependencies
@@ -51,8 +62,23 @@ class BinanceWebSocketDispatcher:
             clock_offset_ms,
         ) = dependencies.capture_timestamp()
         try:
-            msg = json.loads(raw_msg)
+            msg = _decode_frame(
+                raw_msg
+                if isinstance(raw_msg, str)
+                else str(raw_msg, "utf-8")
+            )
+        except (TypeError, ValueError) as exc:
+            dependencies.emit_fault(
+                "WS_PARSE_ERROR",
+                str(exc),
+                raw_msg,
+                expected_generation=expected_generation,
+            )
+            return
         except Exception as exc:
+            # Anything else (RecursionError on deeply nested frames, for
+            # instance) must still fault the transport rather than escape
+            # the websocket-client callback.
             dependencies.emit_fault(
                 "WS_PARSE_ERROR",
                 str(exc),
@@ -60,6 +86,14 @@ class BinanceWebSocketDispatcher:
                 expected_generation=expected_generation,
             )
             return
+        if not isinstance(msg, dict):
+            dependencies.emit_fault(
+                "WS_PARSE_ERROR",
+                f"non-object payload: {type(msg).__name__}",
+                raw_msg,
+                expected_generation=expected_generation,
+            )
+            return
 
         try:
             event_type = msg.get("e")
@@ -92,7 +126,8 @@ class BinanceWebSocketDispatcher:
                 )
                 return
             if "stream" in msg:
-                self.handle_market_update(
+                # The generation was checked above for this frame.
+                self._route_market_update(
                     msg,
                     received_timestamp=received_timestamp,
                     received_monotonic=received_monotonic,
@@ -103,10 +138,14 @@ class BinanceWebSocketDispatcher:
                 return
             if self.is_control_message(msg):
                 return
-            dependencies.log_warning(
-                f"[{dependencies.gateway_name()}] "
-                f"Ignoring unsupported WS payload: {msg}"
-            )
+            with self._ignored_payload_lock:
+                self.ignored_payload_count += 1
+                count = self.ignored_payload_count
+                if count == 1 or count % self.ignored_payload_log_every == 0:
+                    dependencies.log_warning(
+                        f"[{dependencies.gateway_name()}] "
+                        f"Ignoring unsupported WS payload (count={count}): {msg}"
+                    )
         except Exception as exc:
             dependencies.emit_fault(
                 "WS_HANDLER_FAILURE",
@@ -214,9 +253,28 @@ class BinanceWebSocketDispatcher:
         corrected_received_timestamp: float = None,
         expected_generation=None,
     ) -> None:
-        dependencies = self.dependencies
-        if not dependencies.generation_is_current(expected_generation):
+        if not self.dependencies.generation_is_current(expected_generation):
             return
+        self._route_market_update(
+            msg,
+            received_timestamp=received_timestamp,
+            received_monotonic=received_monotonic,
+            clock_offset_ms=clock_offset_ms,
+            corrected_received_timestamp=corrected_received_timestamp,
+            expected_generation=expected_generation,
+        )
+
+    def _route_market_update(
+        self,
+        msg,
+        *,
+        received_timestamp: float = None,
+        received_monotonic: float = None,
+        clock_offset_ms: float = None,
+        corrected_received_timestamp: float = None,
+        expected_generation=None,
+    ) -> None:
+        dependencies = self.dependencies
         effective_clock_offset_ms = float(
             dependencies.clock_offset_ms()
             if clock_offset_ms is None
@@ -6,6 +6,8 @@ import time
 import websocket
 
 from infrastructure.logger import logger
+from infrastructure.thread_scheduling import pin_current_thread
+from .http_adapter import HFT_SOCKET_OPTIONS
 from .constants import (
     WS_MARKET_URL_MAIN,
     WS_PRIVATE_URL_MAIN,
@@ -15,8 +17,21 @@ from .constants import (
 
 
 class BinanceWsApi:
-    def __init__(self, callback, error_callback, testnet=False):
+    def __init__(
+        self,
+        callback,
+        error_callback,
+        testnet=False,
+        *,
+        receive_cpu=None,
+        receive_fifo_priority=None,
+    ):
         self.testnet = bool(testnet)
+        # Optional Linux placement for the receive/decode threads; unset
+        # values leave scheduling to the kernel. ``receive_cpu`` maps a
+        # stream name to its core; streams missing from it are not pinned.
+        self.receive_cpu = dict(receive_cpu or {})
+        self.receive_fifo_priority = receive_fifo_priority
         if self.testnet:
             # Binance Futures testnet still documents the legacy combined
             # stream layout. Keep it isolated from production URL routing so a
@@ -131,6 +146,13 @@ class BinanceWsApi:
             )
 
     def _run(self, url, name):
+        cpu = self.receive_cpu.get(name)
+        if cpu is not None or self.receive_fifo_priority is not None:
+            pin_current_thread(
+                cpu=cpu,
+                fifo_priority=self.receive_fifo_priority,
+                label=name,
+            )
         logger.info(f"[{name}] Connecting...")
         while self._is_active():
             fault_reported = {"value": False}
@@ -153,7 +175,18 @@ class BinanceWsApi:
                 if start_aborted:
                     ws_app.close()
                     return
-                ws_app.run_forever(ping_interval=20, ping_timeout=10)
+                ws_app.run_forever(
+                    ping_interval=20,
+                    ping_timeout=10,
+                    # Same TCP profile as the REST pool; websocket-client
+                    # applies these after its own NODELAY/keepalive defaults.
+                    sockopt=HFT_SOCKET_OPTIONS,
+                    # Frames reach the dispatcher as bytes; its strict UTF-8
+                    # decode faults on bad payloads, so websocket-client need
+                    # not decode first (or run its pure-Python validator on
+                    # fragmented frames).
+                    skip_utf8_validation=True,
+                )
             except Exception as e:
                 self._handle_transport_fault(name, e, fault_reported)
             finally:
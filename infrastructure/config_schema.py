@@ -914,7 +914,26 @@ FRAGMENT_SCHEMAS: dict[str, dict[int, ObjectSpec]] = {
                                 "book_resync_retry_sec": NONNEGATIVE,
                                 "stream_ready_timeout_sec": POSITIVE,
                                 "max_market_event_ingress_age_ms": POSITIVE,
-                            }
+                                "ws_cpu": NONNEGATIVE_INT,
+                                "ws_stream_cpus": _object(
+                                    {
+                                        "PublicWS": NONNEGATIVE_INT,
+                                        "MarketWS": NONNEGATIVE_INT,
+                                        "UserWS": NONNEGATIVE_INT,
+                                    },
+                                    optional=(
+                                        "PublicWS",
+                                        "MarketWS",
+                                        "UserWS",
+                                    ),
+                                ),
+                                "ws_fifo_priority": _integer(1, 99),
+                            },
+                            optional=(
+                                "ws_cpu",
+                                "ws_stream_cpus",
+                                "ws_fifo_priority",
+                            ),
                         )
                     }
                 )
@@ -0,0 +1,52 @@
+"""Best-effort CPU affinity and real-time priority for latency-critical threads.
+
+Both knobs are Linux-specific and SCHED_FIFO additionally needs
+CAP_SYS_NICE. A host that cannot honour them keeps the default scheduler;
+the failure is logged once per thread so a mis-provisioned box is visible
+without turning a latency optimisation into a startup failure.
+"""
+
+from __future__ import annotations
+
+import os
+
+from infrastructure.logger import logger
+
+
+def pin_current_thread(
+    *,
+    cpu: int | None = None,
+    fifo_priority: int | None = None,
+    label: str = "thread",
+) -> bool:
+    """Apply affinity and SCHED_FIFO to the calling thread.
+
+    Returns True only when every requested setting was applied.
+    """
+    applied = True
+    if cpu is not None:
+        setaffinity = getattr(os, "sched_setaffinity", None)
+        try:
+            if setaffinity is None:
+                raise OSError("sched_setaffinity is unavailable")
+            # pid 0 addresses the calling thread on Linux.
+            setaffinity(0, {int(cpu)})
+        except (OSError, ValueError) as exc:
+            applied = False
+            logger.warning(
+                f"[{label}] CPU affinity to core {cpu} not applied: {exc}"
+            )
+    if fifo_priority is not None:
+        setscheduler = getattr(os, "sched_setscheduler", None)
+        policy = getattr(os, "SCHED_FIFO", None)
+        try:
+            if setscheduler is None or policy is None:
+                raise OSError("SCHED_FIFO is unavailable")
+            setscheduler(0, policy, os.sched_param(int(fifo_priority)))
+        except (OSError, ValueError) as exc:
+            applied = False
+            logger.warning(
+                f"[{label}] SCHED_FIFO priority {fifo_priority} "
+                f"not applied: {exc}"
+            )
+    return applied
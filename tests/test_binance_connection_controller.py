@@ -61,6 +61,7 @@ def make_controller(*, connected=True, resync=True, start_streams=True):
         join_book_recovery_threads=lambda: True,
         book_recovery_threads_stopped=lambda: True,
         apply_account_configuration=lambda: True,
+        warm_order_path=lambda: state["trace"].append("order_path.warm"),
         create_ws=create_ws,
         start_streams=lambda ws, symbols, generation: (
             state["trace"].append(
@@ -100,6 +101,8 @@ def test_connect_commits_only_after_stream_and_book_readiness():
         ("BTCUSDT", {"expected_generation": 1})
     ]
     assert state["health"] == []
+    warm = state["trace"].index("order_path.warm")
+    assert state["trace"][warm + 1][0] == "streams.start"
 
 
 def test_connect_timeout_fails_current_generation_closed():
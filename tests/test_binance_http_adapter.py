@@ -0,0 +1,52 @@
+import socket
+
+from gateway.binance.constants import (
+    EP_ALL_OPEN_ORDERS,
+    EP_DEPTH_SNAPSHOT,
+    EP_ORDER,
+    EP_PING,
+)
+from gateway.binance.gateway import BinanceGateway
+from gateway.binance.http_adapter import HFT_SOCKET_OPTIONS, HFTAdapter
+
+
+class DummyEngine:
+    def put(self, _event):
+        return None
+
+
+def test_adapter_pool_applies_low_latency_socket_options():
+    adapter = HFTAdapter(pool_connections=2, pool_maxsize=2)
+
+    options = adapter.poolmanager.connection_pool_kw["socket_options"]
+
+    assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+    assert options == list(HFT_SOCKET_OPTIONS)
+
+
+def test_platform_specific_options_are_only_used_when_exposed():
+    for _level, option, _value in HFT_SOCKET_OPTIONS:
+        assert isinstance(option, int)
+    if hasattr(socket, "TCP_QUICKACK"):
+        assert (socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1) in HFT_SOCKET_OPTIONS
+
+
+def test_order_route_gets_a_dedicated_connection_pool():
+    gateway = BinanceGateway(DummyEngine(), "key", "secret", testnet=True)
+    base_url = gateway.rest.base_url
+
+    order_adapter = gateway.session.get_adapter(
+        f"{base_url}{EP_ORDER}?symbol=BTCUSDT"
+    )
+    snapshot_adapter = gateway.session.get_adapter(
+        f"{base_url}{EP_DEPTH_SNAPSHOT}?symbol=BTCUSDT"
+    )
+
+    assert order_adapter is not snapshot_adapter
+    assert order_adapter is gateway.session.get_adapter(
+        f"{base_url}{EP_ALL_OPEN_ORDERS}?symbol=BTCUSDT"
+    )
+    assert order_adapter is gateway.session.get_adapter(f"{base_url}{EP_PING}")
+    assert order_adapter.poolmanager.connection_pool_kw["maxsize"] == 4
+    gateway.session.close()
@@ -83,6 +83,30 @@ def test_mark_price_uses_event_time_not_next_funding_time():
     assert update.payload.next_funding_timestamp == 3.0
 
 
+def test_mark_ticks_share_the_next_funding_datetime():
+    def mark(symbol, event_ms):
+        return BinanceMarketStreamParser.normalize(
+            make_envelope(
+                f"{symbol.lower()}@markPrice@1s",
+                {
+                    "E": event_ms,
+                    "T": 28_800_000,
+                    "s": symbol,
+                    "p": "100.5",
+                    "i": "100.0",
+                    "r": "0.0001",
+                },
+            )
+        ).payload
+
+    first = mark("BTCUSDT", 2_000)
+    second = mark("ETHUSDT", 3_000)
+
+    assert first.next_funding_time is second.next_funding_time
+    assert first.next_funding_time.timestamp() == 28_800.0
+    assert first.datetime != second.datetime
+
+
 def test_depth_metadata_is_copied_without_mutating_wire_payload():
     wire_data = {"E": 2_000, "s": "BTCUSDT", "U": 1, "u": 2}
     envelope = make_envelope("btcusdt@depth@100ms", wire_data)
@@ -103,3 +127,22 @@ def test_unknown_combined_stream_is_ignored():
     )
 
     assert BinanceMarketStreamParser.normalize(envelope) is None
+
+
+@pytest.mark.parametrize(
+    ("stream", "event_type", "fresh"),
+    [
+        ("btcusdt@depth", EVENT_ORDERBOOK, True),
+        ("btcusdt@depth20@100ms", EVENT_ORDERBOOK, True),
+        ("btcusdt@markPrice", EVENT_MARK_PRICE, False),
+        ("btcusdt@aggTrade", EVENT_AGG_TRADE, True),
+        ("aggTrade", None, False),
+    ],
+)
+def test_stream_channel_is_classified_once_per_envelope(
+    stream, event_type, fresh
+):
+    envelope = make_envelope(stream, {"E": 2_000, "s": "BTCUSDT"})
+
+    assert envelope.event_type == event_type
+    assert envelope.requires_ingress_freshness is fresh
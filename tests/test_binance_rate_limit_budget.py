@@ -20,6 +20,14 @@ class DummyRequest:
         self.params = params or {}
         self.headers = headers or {}
 
+    def copy(self):
+        return DummyRequest(
+            self.method,
+            self.url,
+            dict(self.params),
+            dict(self.headers),
+        )
+
 
 class DummyResponse:
     def __init__(self, status_code=200, payload=None, headers=None):
@@ -0,0 +1,152 @@
+import json
+import threading
+
+from event.type import EVENT_AGG_TRADE
+from gateway.binance.websocket_dispatcher import (
+    BinanceWebSocketDependencies,
+    BinanceWebSocketDispatcher,
+)
+
+
+def make_dispatcher():
+    state = {"faults": [], "warnings": [], "market": [], "books": []}
+    dispatcher = BinanceWebSocketDispatcher(
+        BinanceWebSocketDependencies(
+            gateway_name=lambda: "BINANCE",
+            capture_timestamp=lambda: (1_700_000_000.0, 10.0, 1_700_000_000.0, 0.0),
+            clock_offset_ms=lambda: 0.0,
+            generation_is_current=lambda generation: True,
+            emit_fault=lambda code, detail="", *args, **kwargs: state[
+                "faults"
+            ].append((code, detail)),
+            tracked_symbols=lambda: ("BTCUSDT",),
+            latency_stats=lambda: state.setdefault("latency", {}),
+            max_ingress_age_ms=lambda: 60_000.0,
+            dispatch_transport=lambda generation, callback, payload: callback(
+                payload
+            ),
+            dispatch_market_data=lambda event_type, payload, **kwargs: state[
+                "market"
+            ].append((event_type, payload)),
+            process_book=lambda symbol, payload, **kwargs: state["books"].append(
+                (symbol, payload)
+            ),
+            on_order_update=lambda update: None,
+            on_account_update=lambda update: None,
+            on_log=lambda message, level: None,
+            log_warning=state["warnings"].append,
+            log_error=lambda message: None,
+            wall_time=lambda: 1_700_000_000.0,
+            monotonic=lambda: 10.0,
+        )
+    )
+    return dispatcher, state
+
+
+def test_malformed_and_non_object_frames_fault_the_transport():
+    dispatcher, state = make_dispatcher()
+
+    dispatcher.on_message("{bad-json")
+    dispatcher.on_message("[1, 2]")
+
+    assert [code for code, _detail in state["faults"]] == [
+        "WS_PARSE_ERROR",
+        "WS_PARSE_ERROR",
+    ]
+    assert "non-object payload: list" in state["faults"][1][1]
+
+
+def test_invalid_utf8_binary_frame_faults_the_transport():
+    dispatcher, state = make_dispatcher()
+
+    dispatcher.on_message(b'{"result": "\xff"}')
+
+    assert [code for code, _detail in state["faults"]] == ["WS_PARSE_ERROR"]
+
+
+def test_deeply_nested_frame_faults_instead_of_escaping():
+    dispatcher, state = make_dispatcher()
+
+    dispatcher.on_message("[" * 100_000 + "]" * 100_000)
+
+    assert [code for code, _detail in state["faults"]] == ["WS_PARSE_ERROR"]
+
+
+def test_text_and_binary_frames_decode_to_the_same_route():
+    dispatcher, state = make_dispatcher()
+    raw = json.dumps({"result": None, "id": 1})
+
+    dispatcher.on_message(raw)
+    dispatcher.on_message(raw.encode())
+
+    assert state["faults"] == []
+    assert state["warnings"] == []
+
+
+def test_unsupported_payload_warnings_are_rate_limited():
+    dispatcher, state = make_dispatcher()
+    raw = json.dumps({"unexpected": True})
+
+    for _ in range(250):
+        dispatcher.on_message(raw)
+
+    assert dispatcher.ignored_payload_count == 250
+    assert len(state["warnings"]) == 3
+    assert "count=1)" in state["warnings"][0]
+    assert "count=200)" in state["warnings"][-1]
+    assert state["faults"] == []
+
+
+def test_unsupported_payload_count_is_exact_across_receive_threads():
+    dispatcher, state = make_dispatcher()
+    raw = json.dumps({"unexpected": True})
+    start = threading.Barrier(4)
+
+    def receive():
+        start.wait()
+        for _ in range(500):
+            dispatcher.on_message(raw)
+
+    threads = [threading.Thread(target=receive) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert dispatcher.ignored_payload_count == 2000
+    assert [
+        int(message.split("count=", 1)[1].split(")", 1)[0])
+        for message in state["warnings"]
+    ] == [1, *range(100, 2001, 100)]
+
+
+def test_market_frame_checks_the_generation_once():
+    dispatcher, state = make_dispatcher()
+    checks = []
+    object.__setattr__(
+        dispatcher.dependencies,
+        "generation_is_current",
+        lambda generation: checks.append(generation) or True,
+    )
+    raw = json.dumps(
+        {
+            "stream": "btcusdt@aggTrade",
+            "data": {
+                "e": "aggTrade",
+                "E": 1_700_000_000_000,
+                "T": 1_700_000_000_000,
+                "s": "BTCUSDT",
+                "a": 1,
+                "p": "100.0",
+                "q": "1.0",
+                "m": False,
+            },
+        }
+    )
+
+    dispatcher.on_message(raw, expected_generation=7)
+
+    assert checks == [7]
+    assert [event_type for event_type, _payload in state["market"]] == [
+        EVENT_AGG_TRADE
+    ]
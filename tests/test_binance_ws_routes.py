@@ -1,7 +1,10 @@
+import socket
 import unittest
 import time
 from unittest.mock import patch
 
+from gateway.binance.gateway import BinanceGateway
+from gateway.binance.http_adapter import HFT_SOCKET_OPTIONS
 from gateway.binance.ws_api import BinanceWsApi
 
 
@@ -160,6 +163,92 @@ class BinanceWebSocketRouteTests(unittest.TestCase):
         self.assertTrue(api.close_requested)
         self.assertEqual(api.stream_threads, {})
 
+    def test_receive_thread_applies_configured_placement_before_connecting(self):
+        api = BinanceWsApi(
+            lambda _message: None,
+            lambda _error: None,
+            receive_cpu={"PublicWS": 2},
+            receive_fifo_priority=50,
+        )
+
+        with patch("gateway.binance.ws_api.pin_current_thread") as pin:
+            api._run("wss://example.invalid", "PublicWS")
+
+        pin.assert_called_once_with(cpu=2, fifo_priority=50, label="PublicWS")
+
+    def test_receive_thread_uses_its_stream_core_from_a_mapping(self):
+        api = BinanceWsApi(
+            lambda _message: None,
+            lambda _error: None,
+            receive_cpu={"PublicWS": 2, "UserWS": 4},
+        )
+
+        with patch("gateway.binance.ws_api.pin_current_thread") as pin:
+            api._run("wss://example.invalid", "UserWS")
+            api._run("wss://example.invalid", "MarketWS")
+
+        pin.assert_called_once_with(cpu=4, fifo_priority=None, label="UserWS")
+
+    def test_gateway_normalizes_stream_cores_to_one_mapping(self):
+        engine = type("Engine", (), {"put": lambda self, _event: None})()
+        configs = (
+            ({}, {"PublicWS": None, "MarketWS": None, "UserWS": None}),
+            ({"ws_cpu": 1}, {"PublicWS": 1, "MarketWS": 1, "UserWS": 1}),
+            (
+                {"ws_cpu": 1, "ws_stream_cpus": {"UserWS": 3}},
+                {"PublicWS": 1, "MarketWS": 1, "UserWS": 3},
+            ),
+        )
+        for config, expected in configs:
+            with self.subTest(config=config):
+                gateway = BinanceGateway(
+                    engine,
+                    "key",
+                    "secret",
+                    testnet=True,
+                    market_data_config=config,
+                )
+                self.addCleanup(gateway.session.close)
+                self.assertEqual(gateway.ws_cpu, expected)
+
+    def test_receive_thread_placement_is_skipped_when_unconfigured(self):
+        api = BinanceWsApi(lambda _message: None, lambda _error: None)
+
+        with patch("gateway.binance.ws_api.pin_current_thread") as pin:
+            api._run("wss://example.invalid", "PublicWS")
+
+        pin.assert_not_called()
+
+    def test_stream_sockets_use_low_latency_tcp_options(self):
+        api = BinanceWsApi(lambda _message: None, lambda _error: None)
+        api.active = True
+        run_kwargs = []
+
+        class RecordingSocket:
+            def __init__(self, *_args, **_kwargs):
+                pass
+
+            def run_forever(self, **kwargs):
+                run_kwargs.append(kwargs)
+                api.active = False
+
+            def close(self):
+                pass
+
+        with patch(
+            "gateway.binance.ws_api.websocket.WebSocketApp",
+            RecordingSocket,
+        ):
+            api._run("wss://example.invalid", "PublicWS")
+
+        self.assertEqual(len(run_kwargs), 1)
+        self.assertEqual(run_kwargs[0]["sockopt"], HFT_SOCKET_OPTIONS)
+        self.assertIn(
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+            run_kwargs[0]["sockopt"],
+        )
+        self.assertTrue(run_kwargs[0]["skip_utf8_validation"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -203,6 +203,36 @@ class EventEngineHotPathTests(unittest.TestCase):
                     0,
                 )
 
+    def test_drained_lane_capacity_is_available_again(self):
+        engine = EventEngine({"queue_capacity": 2})
+        seen = []
+        engine.register_market("eRefill", lambda event: seen.append(event.data))
+
+        self.assertTrue(engine.put(Event("eRefill", 1)))
+        self.assertTrue(engine.put(Event("eRefill", 2)))
+        self.assertFalse(engine.put(Event("eRefill", "overflow")))
+        engine.process_existing_events()
+        self.assertTrue(engine.put(Event("eRefill", 3)))
+        engine.process_existing_events()
+
+        self.assertEqual(seen, [1, 2, 3])
+        self.assertEqual(engine.get_queue_snapshot()["market_depth"], 0)
+
+    def test_handler_registered_after_routing_receives_later_events(self):
+        engine = EventEngine()
+        seen = []
+        engine.register_market("eLate", lambda event: seen.append(("market", event.data)))
+
+        self.assertTrue(engine.put(Event("eLate", 1)))
+        engine.register_cold("eLate", lambda event: seen.append(("cold", event.data)))
+        self.assertTrue(engine.put(Event("eLate", 2)))
+        engine.process_existing_events()
+
+        self.assertEqual(
+            seen,
+            [("market", 1), ("market", 2), ("cold", 2)],
+        )
+
     def test_cold_handoff_overflow_does_not_leak_pending_work(self):
         failures = []
         engine = EventEngine(
@@ -0,0 +1,170 @@
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from data.ref_data import ContractInfo, ref_data_manager
+from event.type import OrderBook, OrderData, OrderStatus
+from execution.chaser import ChaseAlgo
+from execution.iceberg import IcebergAlgo
+from execution.twap import TWAPAlgo
+
+
+class _RecordingStrategy:
+    def __init__(self):
+        self.calls = []
+        self.active_orders = {}
+        self._next_id = 0
+
+    def _send(self, side, symbol, price, volume):
+        self._next_id += 1
+        self.calls.append((side, symbol, price, volume))
+        return f"child-{self._next_id}"
+
+    def buy(self, symbol, price, volume):
+        return self._send("BUY", symbol, price, volume)
+
+    def sell(self, symbol, price, volume):
+        return self._send("SELL", symbol, price, volume)
+
+    def cancel_order(self, order_id):
+        self.calls.append(("CANCEL", order_id))
+
+    def cancel_all(self, symbol):
+        self.calls.append(("CANCEL_ALL", symbol))
+
+
+class ExecutionAlgoTests(unittest.TestCase):
+    def setUp(self):
+        contract = ContractInfo(
+            symbol="LTCUSDT",
+            tick_size=0.1,
+            step_size=0.001,
+            min_qty=0.001,
+            min_notional=5.0,
+            price_precision=1,
+            qty_precision=3,
+        )
+        patcher = patch.dict(ref_data_manager.contracts, {"LTCUSDT": contract}, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.strategy = _RecordingStrategy()
+
+    @staticmethod
+    def make_book():
+        return OrderBook(
+            symbol="LTCUSDT",
+            exchange="BINANCE",
+            datetime=datetime(2024, 1, 1),
+            bids={99.9: 1.0},
+            asks={100.1: 1.0},
+        )
+
+    @staticmethod
+    def filled(order_id, volume):
+        return OrderData(
+            symbol="LTCUSDT",
+            order_id=order_id,
+            side="BUY",
+            price=100.0,
+            volume=volume,
+            traded=volume,
+            status=OrderStatus.FILLED,
+            datetime=datetime(2024, 1, 1),
+        )
+
+    def test_missing_step_size_is_rejected(self):
+        with self.assertRaises(ValueError):
+            ChaseAlgo("algo", "BTCUSDT", "BUY", 1.0, None, self.strategy)
+
+    def test_quantities_round_down_to_whole_lots(self):
+        algo = ChaseAlgo("algo", "LTCUSDT", "BUY", 0.0105, None, self.strategy)
+
+        self.assertEqual(algo.total_lots, 10)
+        self.assertEqual(algo.to_lots(0.0019), 1)
+        self.assertEqual(algo.to_lots(2.4), 2400)
+
+    def test_twap_slices_total_over_duration(self):
+        algo = TWAPAlgo("algo", "LTCUSDT", "BUY", 0.01, None, self.strategy, duration=300, interval=60)
+        self.assertEqual(algo.slice_lots, 2)
+
+        algo.place_slice(self.make_book())
+
+        self.assertEqual(self.strategy.calls, [("BUY", "LTCUSDT", 100.1, 0.002)])
+        self.assertEqual(algo.active_orders, {"child-1": 2})
+
+    def test_twap_without_duration_sends_everything_in_one_slice(self):
+        algo = TWAPAlgo("algo", "LTCUSDT", "SELL", 0.0107, None, self.strategy, duration=0)
+        self.assertEqual(algo.slice_lots, 10)
+
+        algo.place_slice(self.make_book())
+
+        self.assertEqual(self.strategy.calls, [("SELL", "LTCUSDT", 99.9, 0.01)])
+
+    def test_iceberg_replenishes_visible_size_until_parent_is_filled(self):
+        algo = IcebergAlgo(
+            "algo", "LTCUSDT", "BUY", 0.005, None, self.strategy, visible_vol=0.002, price_limit=100.0
+        )
+        algo.start()
+        algo.on_order(self.filled("child-1", 0.002))
+        algo.on_order(self.filled("child-2", 0.002))
+        algo.on_order(self.filled("child-3", 0.001))
+
+        self.assertEqual(
+            [call[3] for call in self.strategy.calls],
+            [0.002, 0.002, 0.001],
+        )
+        self.assertTrue(algo.finished)
+        self.assertEqual(algo.traded_vol, 0.005)
+
+    def test_chase_sends_remaining_whole_lots_only(self):
+        algo = ChaseAlgo("algo", "LTCUSDT", "BUY", 0.0105, None, self.strategy)
+
+        algo._send_new(99.9)
+        self.assertEqual(self.strategy.calls, [("BUY", "LTCUSDT", 99.9, 0.01)])
+
+        # 成交回报带浮点噪声时也不能多记成交量
+        algo.on_order(self.filled("child-1", 0.0099999999))
+        self.assertEqual(algo.left_lots, 1)
+        self.assertFalse(algo.finished)
+
+    def test_chase_requotes_when_best_bid_moves(self):
+        algo = ChaseAlgo("algo", "LTCUSDT", "BUY", 0.01, None, self.strategy)
+        book = self.make_book()
+
+        algo.on_tick(book)
+        book.bids = {100.0: 1.0}
+        algo.on_tick(book)
+
+        self.assertEqual(
+            self.strategy.calls,
+            [
+                ("BUY", "LTCUSDT", 99.9, 0.01),
+                ("CANCEL", "child-1"),
+                ("BUY", "LTCUSDT", 100.0, 0.01),
+            ],
+        )
+
+    def test_stop_cancels_only_own_children(self):
+        algo = IcebergAlgo(
+            "algo", "LTCUSDT", "BUY", 0.01, None, self.strategy, visible_vol=0.002, price_limit=100.0
+        )
+        algo.start()
+        algo.active_orders["child-2"] = 2
+        # 策略视角下该品种只有算法子单，但账户上还挂着别处下的同品种订单
+        self.strategy.active_orders = {
+            "child-1": SimpleNamespace(symbol="LTCUSDT"),
+            "child-2": SimpleNamespace(symbol="LTCUSDT"),
+        }
+        exchange_orders = {"child-1", "child-2", "foreign"}
+
+        algo.stop()
+
+        cancels = [call for call in self.strategy.calls if call[0].startswith("CANCEL")]
+        self.assertEqual(cancels, [("CANCEL", "child-1"), ("CANCEL", "child-2")])
+        exchange_orders -= {call[1] for call in cancels}
+        self.assertEqual(exchange_orders, {"foreign"})
+
+
+if __name__ == "__main__":
+    unittest.main()
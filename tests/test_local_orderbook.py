@@ -0,0 +1,124 @@
+import heapq
+
+import pytest
+
+from data.orderbook import LocalOrderBook
+from event.type import OrderBookGapError
+
+
+def make_book(levels=10, depth=3):
+    book = LocalOrderBook(
+        "BTCUSDT",
+        publish_depth_levels=depth,
+        max_levels_per_side=64,
+    )
+    book.init_snapshot(
+        {
+            "lastUpdateId": 10,
+            "bids": [[f"{100 - i}", "1"] for i in range(1, levels + 1)],
+            "asks": [[f"{100 + i}", "1"] for i in range(1, levels + 1)],
+        }
+    )
+    return book
+
+
+def apply(book, bids=(), asks=()):
+    update_id = book.last_update_id + 1
+    book.process_delta(
+        {
+            "U": update_id,
+            "u": update_id,
+            "pu": book.last_update_id,
+            "b": [list(level) for level in bids],
+            "a": [list(level) for level in asks],
+            "E": 1_700_000_000_000,
+        },
+        received_timestamp=1_700_000_000.0,
+        received_monotonic=1.0,
+    )
+
+
+def assert_published_levels_match_full_book(book):
+    assert book.top_bids == tuple(
+        heapq.nlargest(book.publish_depth_levels, book.bids.items())
+    )
+    assert book.top_asks == tuple(
+        heapq.nsmallest(book.publish_depth_levels, book.asks.items())
+    )
+    assert (book.best_bid_price, book.best_bid_volume) == book.top_bids[0]
+    assert (book.best_ask_price, book.best_ask_volume) == book.top_asks[0]
+
+
+def test_incremental_published_levels_track_full_reselection():
+    book = make_book()
+    updates = [
+        {"bids": [("99", "2.5")]},
+        {"asks": [("102", "0.5")]},
+        {"bids": [("99", "0")]},
+        {"bids": [("99.5", "4")], "asks": [("101", "0")]},
+        {"bids": [("95", "7")], "asks": [("110", "3")]},
+        {"asks": [("100.5", "1.5"), ("102", "0")]},
+    ]
+
+    for update in updates:
+        apply(book, **update)
+        assert_published_levels_match_full_book(book)
+
+
+def test_crossing_delta_is_rejected_from_cached_best_quotes():
+    book = make_book()
+
+    with pytest.raises(OrderBookGapError, match="crossed order book"):
+        apply(book, bids=[("101", "1")])
+
+    assert not book.initialized
+
+
+def test_delta_that_empties_a_side_is_rejected():
+    book = make_book(levels=1, depth=1)
+
+    with pytest.raises(OrderBookGapError, match="side is empty"):
+        apply(book, asks=[("101", "0")])
+
+
+def test_unchanged_side_view_is_shared_between_events():
+    book = make_book()
+    first = book.generate_event_data()
+
+    apply(book, asks=[("101", "2")])
+    second = book.generate_event_data()
+
+    assert second.bids is first.bids
+    assert second.asks is not first.asks
+    assert second.asks == dict(book.top_asks)
+    assert first.asks[101.0] == 1.0
+
+
+def test_full_book_events_copy_only_the_side_that_changed():
+    book = LocalOrderBook(
+        "BTCUSDT",
+        publish_depth_levels=2,
+        emit_full_book=True,
+        max_levels_per_side=64,
+    )
+    book.init_snapshot(
+        {
+            "lastUpdateId": 10,
+            "bids": [[f"{100 - i}", "1"] for i in range(1, 6)],
+            "asks": [[f"{100 + i}", "1"] for i in range(1, 6)],
+        }
+    )
+    first = book.generate_event_data()
+
+    apply(book, asks=[("105", "3")])
+    second = book.generate_event_data()
+    apply(book, bids=[("95", "0")])
+    third = book.generate_event_data()
+
+    assert second.bids is first.bids
+    assert second.asks[105.0] == 3.0
+    assert first.asks[105.0] == 1.0
+    assert third.asks is second.asks
+    assert 95.0 in second.bids
+    assert 95.0 not in third.bids
+    assert third.bids == book.bids
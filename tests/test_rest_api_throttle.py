@@ -1,7 +1,10 @@
+import hashlib
+import hmac
 import sys
 import types
 import unittest
 from unittest.mock import Mock, patch
+from urllib.parse import urlencode
 
 if "requests" not in sys.modules:
     requests_module = types.ModuleType("requests")
@@ -13,6 +16,9 @@ if "requests" not in sys.modules:
             self.params = params or {}
             self.headers = headers or {}
 
+        def copy(self):
+            return Request(self.method, self.url, self.params, self.headers)
+
     requests_module.Request = Request
     requests_module.Session = lambda: None
     requests_module.get = lambda *args, **kwargs: None
@@ -23,12 +29,13 @@ from event.type import OrderIntent, OrderRequest, Side, TIF_GTX, TIF_RPI
 from gateway.binance.constants import (
     EP_COMMISSION_RATE,
     EP_COUNTDOWN_CANCEL_ALL,
+    EP_DEPTH_SNAPSHOT,
     EP_INCOME,
     EP_ORDER,
     EP_POSITION_RISK,
     EP_RPI_DEPTH,
 )
-from gateway.binance.rest_api import BinanceRestApi
+from gateway.binance.rest_api import BinanceRestApi, _encode_query
 from oms.engine import OMS
 from oms.order import Order
 from oms.validator import OrderValidator
@@ -74,6 +81,14 @@ class DummyRequest:
         self.params = params or {}
         self.headers = headers or {}
 
+    def copy(self):
+        return DummyRequest(
+            self.method,
+            self.url,
+            dict(self.params),
+            dict(self.headers),
+        )
+
 
 class RestApiThrottleTests(unittest.TestCase):
     def test_failed_endpoint_enters_cooldown(self):
@@ -326,6 +341,110 @@ class RestApiThrottleTests(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(session.responses), 0)
 
+    @patch("gateway.binance.rest_api.requests.Request", DummyRequest)
+    def test_route_template_is_prepared_once_and_copied_per_send(self):
+        session = SequenceSession(
+            [DummyResponse(200, {}), DummyResponse(200, {})]
+        )
+        prepared = []
+        sent = []
+        prepare_request = session.prepare_request
+        session.prepare_request = lambda req: prepared.append(req) or (
+            prepare_request(req)
+        )
+        send = session.send
+        session.send = lambda prepped, timeout=None: sent.append(prepped) or (
+            send(prepped, timeout=timeout)
+        )
+        api = BinanceRestApi("key", "secret", session, testnet=True)
+        api.min_signed_interval_sec = 0.0
+        api.endpoint_intervals[EP_POSITION_RISK] = 0.0
+
+        for _ in range(2):
+            api.request("GET", EP_POSITION_RISK, {"symbol": "BTCUSDT"})
+
+        self.assertEqual(len(prepared), 1)
+        self.assertEqual(prepared[0].params, {})
+        self.assertEqual(prepared[0].headers, {"X-MBX-APIKEY": "key"})
+        self.assertEqual(len(sent), 2)
+        self.assertIsNot(sent[0], sent[1])
+        self.assertEqual(prepared[0].url, api.base_url + EP_POSITION_RISK)
+        for prepped in sent:
+            path, query = prepped.url.split("?", 1)
+            self.assertEqual(path, api.base_url + EP_POSITION_RISK)
+            self.assertTrue(query.startswith("symbol=BTCUSDT&timestamp="))
+            self.assertIn("&signature=", query)
+
+    @patch("gateway.binance.rest_api.requests.Request", DummyRequest)
+    def test_route_templates_do_not_leak_headers_or_cookies(self):
+        session = SequenceSession([DummyResponse(200, {}) for _ in range(5)])
+        sent = []
+        send = session.send
+        session.send = lambda prepped, timeout=None: sent.append(prepped) or (
+            send(prepped, timeout=timeout)
+        )
+        api = BinanceRestApi("key", "secret", session, testnet=True)
+        api.min_signed_interval_sec = 0.0
+        api.min_public_interval_sec = 0.0
+        api.endpoint_intervals[EP_POSITION_RISK] = 0.0
+
+        api.request("GET", EP_POSITION_RISK, {"symbol": "BTCUSDT"})
+        # A response hook or adapter mutating the sent copy must not reach
+        # the cached template or a different route.
+        sent[0].headers["Cookie"] = "session=abc"
+        api.request("GET", EP_DEPTH_SNAPSHOT, {"symbol": "BTCUSDT"}, signed=False)
+        api.request("GET", EP_POSITION_RISK, {"symbol": "BTCUSDT"})
+
+        self.assertEqual(sent[1].headers, {})
+        self.assertEqual(sent[2].headers, {"X-MBX-APIKEY": "key"})
+        self.assertEqual(len(api._prepared_templates), 2)
+
+        # A session carrying cookies is prepared per request, never cached.
+        session.cookies = {"session": "abc"}
+        prepared = []
+        prepare_request = session.prepare_request
+        session.prepare_request = lambda req: prepared.append(req) or (
+            prepare_request(req)
+        )
+        api._prepared_templates.clear()
+        for _ in range(2):
+            api.request("GET", EP_POSITION_RISK, {"symbol": "BTCUSDT"})
+
+        self.assertEqual(len(prepared), 2)
+        self.assertEqual(api._prepared_templates, {})
+
+    def test_query_encoder_matches_urlencode(self):
+        cases = [
+            {},
+            {"symbol": "BTCUSDT", "price": 65000.1, "quantity": 1e-05},
+            {"newClientOrderId": "x-abc_1.2~3", "reduceOnly": "true"},
+            {"dualSidePosition": True, "timestamp": 1700000000000},
+            {"newClientOrderId": "a&b=c"},
+            {"incomeType": "FUNDING FEE", "symbol": "BTC/USDT"},
+            {"note": "caf\u00e9"},
+        ]
+        for params in cases:
+            with self.subTest(params=params):
+                self.assertEqual(_encode_query(params), urlencode(params))
+
+    def test_signature_matches_reference_hmac_across_secret_rotation(self):
+        api = BinanceRestApi("key", "secret", DummySession(), testnet=True)
+        params = {"symbol": "BTCUSDT", "timestamp": 1700000000000}
+
+        for secret in ("secret", "rotated-secret"):
+            api.api_secret = secret
+            for _ in range(2):
+                query = api._signed_query(dict(params))
+                expected = hmac.new(
+                    secret.encode(),
+                    urlencode(params).encode(),
+                    hashlib.sha256,
+                ).hexdigest()
+                self.assertEqual(
+                    query,
+                    f"{urlencode(params)}&signature={expected}",
+                )
+
 
 class RPICoreIntegrationTests(unittest.TestCase):
     def setUp(self):
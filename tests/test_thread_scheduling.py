@@ -0,0 +1,56 @@
+import os
+
+from infrastructure import thread_scheduling
+from infrastructure.thread_scheduling import pin_current_thread
+
+
+def test_pin_applies_affinity_and_fifo_to_calling_thread(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        os,
+        "sched_setaffinity",
+        lambda pid, cpus: calls.append(("affinity", pid, cpus)),
+        raising=False,
+    )
+    monkeypatch.setattr(
+        os,
+        "sched_setscheduler",
+        lambda pid, policy, param: calls.append(
+            ("scheduler", pid, policy, param.sched_priority)
+        ),
+        raising=False,
+    )
+    monkeypatch.setattr(os, "SCHED_FIFO", 1, raising=False)
+
+    assert pin_current_thread(cpu=3, fifo_priority=50, label="PublicWS")
+    assert calls == [
+        ("affinity", 0, {3}),
+        ("scheduler", 0, 1, 50),
+    ]
+
+
+def test_unprivileged_host_keeps_default_scheduler(monkeypatch):
+    warnings = []
+
+    def reject(*_args):
+        raise PermissionError("operation not permitted")
+
+    monkeypatch.setattr(os, "sched_setaffinity", reject, raising=False)
+    monkeypatch.setattr(os, "sched_setscheduler", reject, raising=False)
+    monkeypatch.setattr(os, "SCHED_FIFO", 1, raising=False)
+    monkeypatch.setattr(
+        thread_scheduling.logger,
+        "warning",
+        warnings.append,
+    )
+
+    assert not pin_current_thread(cpu=2, fifo_priority=80, label="MarketWS")
+    assert len(warnings) == 2
+    assert "core 2" in warnings[0]
+    assert "SCHED_FIFO priority 80" in warnings[1]
+
+
+def test_no_requested_settings_is_a_no_op(monkeypatch):
+    monkeypatch.delattr(os, "sched_setaffinity", raising=False)
+
+    assert pin_current_thread()
@@ -870,6 +870,8 @@ class GatewayRecoveryTests(unittest.TestCase):
         gateway.event_engine = engine
         gateway.gateway_name = "BINANCE"
         gateway.testnet = True
+        gateway.ws_cpu = {}
+        gateway.ws_fifo_priority = None
         gateway.symbols = ["BTCUSDT"]
         gateway.orderbooks = {}
         gateway.ws_buffer = {}
@@ -906,6 +908,8 @@ class GatewayRecoveryTests(unittest.TestCase):
         gateway.event_engine = engine
         gateway.gateway_name = "BINANCE"
         gateway.testnet = True
+        gateway.ws_cpu = {}
+        gateway.ws_fifo_priority = None
         gateway.symbols = ["BTCUSDT"]
         gateway.orderbooks = {}
         gateway.ws_buffer = {}
@@ -950,6 +954,8 @@ class GatewayRecoveryTests(unittest.TestCase):
         gateway.event_engine = engine
         gateway.gateway_name = "BINANCE"
         gateway.testnet = True
+        gateway.ws_cpu = {}
+        gateway.ws_fifo_priority = None
         gateway.symbols = ["BTCUSDT"]
         gateway.orderbooks = {}
         gateway.ws_buffer = {}
@@ -1004,6 +1010,8 @@ class GatewayRecoveryTests(unittest.TestCase):
         gateway.event_engine = engine
         gateway.gateway_name = "BINANCE"
         gateway.testnet = True
+        gateway.ws_cpu = {}
+        gateway.ws_fifo_priority = None
         gateway.symbols = ["BTCUSDT"]
         gateway.orderbooks = {}
         gateway.ws_buffer = {}
@@ -1122,6 +1130,8 @@ class GatewayRecoveryTests(unittest.TestCase):
         gateway.event_engine = engine
         gateway.gateway_name = "BINANCE"
         gateway.testnet = True
+        gateway.ws_cpu = {}
+        gateway.ws_fifo_priority = None
         gateway.symbols = []
         gateway.orderbooks = {}
         gateway.ws_buffer = {}